@@ -1,10 +1,18 @@
 #!/usr/bin/env python3
 import sys
+import signal
 import asyncio
 from .utils.config import load_config, validate_config
 from .utils.logging import setup_logging
 from .core.updater import DNSUpdater
 
+async def run(updater):
+   # docker stop and systemd send SIGTERM; cancelling the task unwinds
+   # DNSUpdater.run so the lease is released before exiting
+   task = asyncio.current_task()
+   asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)
+   await updater.run()
+
 def main():
    try:
        config = load_config()
@@ -25,8 +33,14 @@ def main():
            'refresh_interval': config['refresh_interval']
        })
        
-       asyncio.run(updater.run())
+       asyncio.run(run(updater))
        
+   except asyncio.CancelledError:
+       logger.info('Shutting down SI-IP', extra={
+           'operation': 'shutdown',
+           'shutdown_type': 'signal'
+       })
+       return 0
    except KeyboardInterrupt:
        logger.info('Shutting down SI-IP', extra={
            'operation': 'shutdown',
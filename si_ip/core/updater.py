@@ -1,24 +1,33 @@
 import asyncio
-from typing import Optional
+from typing import Dict, Optional
 from ..providers import get_provider
+from ..leases import get_lease
 from ..resolvers.ip import IPResolver
 
 class DNSUpdater:
+   RECORD_TYPES = {4: 'A', 6: 'AAAA'}
+
    def __init__(self, config, logger):
        self.config = config
        self.logger = logger
        self.running = False
+       self.is_leader = False
+       self.initialized = False
+       self.record_ips: Dict[str, str] = {}
        
        Provider = get_provider(config['provider'])
        self.dns_provider = Provider(config, logger)
        self.ip_resolver = IPResolver()
 
+       Lease = get_lease(config.get('lease', 'none'))
+       self.lease = Lease(config, logger)
+
    async def check_dependencies(self) -> bool:
        """Verify all required dependencies are working"""
        try:
            # Check IP resolver
-           test_ip = await self.ip_resolver.get_ip()
-           if not test_ip:
+           test_ips = await self.get_local_ips()
+           if not test_ips:
                self.logger.error('IP resolver check failed', extra={
                    'operation': 'dependency_check',
                    'component': 'ip_resolver'
@@ -28,7 +37,7 @@ class DNSUpdater:
            self.logger.debug('IP resolver check successful', extra={
                'operation': 'dependency_check',
                'component': 'ip_resolver',
-               'ip': test_ip
+               'ips': test_ips
            })
 
            # Check DNS provider
@@ -57,6 +66,14 @@ class DNSUpdater:
            })
            return False
 
+   async def get_local_ips(self) -> Dict[str, str]:
+       """Resolve public IPv4 and IPv6 in one pass, keyed by record type"""
+       ips = await self.ip_resolver.get_ips()
+       return {
+           self.RECORD_TYPES[version]: ip
+           for version, ip in ips.items() if ip
+       }
+
    async def initialize_record(self) -> bool:
        """Create initial DNS record if it doesn't exist"""
        try:
@@ -68,10 +85,13 @@ class DNSUpdater:
                    'operation': 'record_init'
                })
                
-               local_ip = await self.ip_resolver.get_ip()
-               success = await self.dns_provider.create_record(
+               local_ips = await self.get_local_ips()
+               if not await self.check_lease():
+                   return False
+
+               success = await self.dns_provider.create_records(
                    self.config['record_name'], 
-                   local_ip
+                   local_ips
                )
                
                if not success:
@@ -83,7 +103,7 @@ class DNSUpdater:
                    
                self.logger.info('Initial DNS record created successfully', extra={
                    'record_name': self.config['record_name'],
-                   'ip': local_ip,
+                   'ips': local_ips,
                    'operation': 'record_init'
                })
            else:
@@ -106,45 +126,63 @@ class DNSUpdater:
    async def check_and_update(self) -> None:
        """Perform single check and update iteration"""
        try:
-           local_ip = await self.ip_resolver.get_ip()
-           self.logger.debug('Current IP fetched', extra={
-               'ip': local_ip,
+           local_ips = await self.get_local_ips()
+           self.logger.debug('Current IPs fetched', extra={
+               'ips': local_ips,
                'operation': 'ip_check'
            })
 
-           current_ip = await self.dns_provider.get_record_ip(self.config['record_name'])
-           self.logger.debug('DNS record IP fetched', extra={
-               'ip': current_ip,
+           current_ips = await self.dns_provider.get_record_ips(self.config['record_name'])
+           self.logger.debug('DNS record IPs fetched', extra={
+               'ips': current_ips,
                'operation': 'dns_check'
            })
+           self.record_ips = {
+               record_type: ip for record_type, ip in current_ips.items() if ip
+           }
+
+           # Only families we could resolve are written; a missing IPv6
+           # uplink leaves an existing AAAA record untouched.
+           changes = {
+               record_type: ip for record_type, ip in local_ips.items()
+               if current_ips.get(record_type) != ip
+           }
            
-           if local_ip != current_ip:
+           if changes:
+               old_ips = {record_type: current_ips.get(record_type) for record_type in changes}
                self.logger.info('IP change detected', extra={
-                   'old_ip': current_ip,
-                   'new_ip': local_ip,
+                   'old_ips': old_ips,
+                   'new_ips': changes,
                    'record_name': self.config['record_name'],
                    'operation': 'ip_change'
                })
+
+               # Resolving may have outlasted the lease; this only hits the
+               # lease backend when less than half the ttl is left
+               if not await self.check_lease():
+                   return
                
-               success = await self.dns_provider.update_record(
+               success = await self.dns_provider.update_records(
                    self.config['record_name'],
-                   local_ip
+                   changes
                )
                
-               if not success:
+               if success:
+                   self.record_ips.update(changes)
+               else:
                    self.logger.error('Failed to update record', extra={
                        'operation': 'record_update',
                        'record_name': self.config['record_name'],
-                       'old_ip': current_ip,
-                       'new_ip': local_ip
+                       'old_ips': old_ips,
+                       'new_ips': changes
                    })
            else:
                self.logger.debug('No IP change detected', extra={
-                   'ip': local_ip,
+                   'ips': local_ips,
                    'operation': 'ip_check'
                })
                self.logger.info(f"Record [{self.config['record_name']}.] are already up to date", extra={
-                   'ip': local_ip,
+                   'ips': local_ips,
                    'record_name': self.config['record_name'],
                    'operation': 'record_status'
                })
@@ -158,17 +196,51 @@ class DNSUpdater:
            })
            raise
 
+   async def check_lease(self) -> bool:
+       """Acquire or renew the lease, tracking leadership changes"""
+       # A holder with more than half the ttl left skips the lease backend
+       if self.is_leader and not self.lease.needs_renewal():
+           return True
+
+       previous_holder = self.lease.holder
+       # Standbys renew nothing, they keep whatever state the holder published
+       is_leader = await self.lease.acquire(self.record_ips if self.is_leader else None)
+
+       if is_leader and not self.is_leader:
+           # Republish the shadowed state until our first provider read
+           self.record_ips = dict(self.lease.state)
+           self.logger.info('Lease acquired, this instance is now the writer', extra={
+               'instance_id': self.lease.holder_id,
+               'previous_holder': previous_holder,
+               'ips': self.record_ips,
+               'record_name': self.config['record_name'],
+               'operation': 'lease_acquire'
+           })
+       elif not is_leader and self.is_leader:
+           self.logger.warning('Lease lost, switching to standby', extra={
+               'instance_id': self.lease.holder_id,
+               'holder': self.lease.holder,
+               'record_name': self.config['record_name'],
+               'operation': 'lease_lost'
+           })
+       elif not is_leader:
+           self.logger.debug('Standing by, lease held by another instance', extra={
+               'instance_id': self.lease.holder_id,
+               'holder': self.lease.holder,
+               'ips': self.lease.state,
+               'operation': 'lease_standby'
+           })
+
+       self.is_leader = is_leader
+       return is_leader
+
    async def run(self) -> None:
        """Main run loop"""
        try:
-           # Initial checks
-           if not await self.check_dependencies():
-               raise RuntimeError("Dependency check failed")
-
-           if not await self.initialize_record():
-               raise RuntimeError("Record initialization failed")
-
            interval = float(self.config['refresh_interval'])
+           # Standbys poll the lease more often than the refresh interval so
+           # takeover happens at most ttl + ttl / 3 after the last renewal
+           standby_interval = min(interval, self.lease.ttl / 3)
            self.logger.debug('Starting update loop', extra={
                'refresh_interval': interval,
                'operation': 'update_loop'
@@ -177,9 +249,21 @@ class DNSUpdater:
            self.running = True
            while self.running:
                start_time = asyncio.get_event_loop().time()
+
+               # Only the lease holder resolves and writes the record set,
+               # standbys never touch the resolvers or the provider
+               if await self.check_lease() and not self.initialized:
+                   if not await self.check_dependencies():
+                       raise RuntimeError("Dependency check failed")
+
+                   if await self.initialize_record():
+                       self.initialized = True
+                   elif self.is_leader:
+                       raise RuntimeError("Record initialization failed")
                
                try:
-                   await self.check_and_update()
+                   if self.is_leader:
+                       await self.check_and_update()
                except Exception as e:
                    self.logger.error('Update iteration failed', extra={
                        'error': str(e),
@@ -189,7 +273,7 @@ class DNSUpdater:
 
                # Calculate sleep time
                elapsed = asyncio.get_event_loop().time() - start_time
-               sleep_time = max(0, interval - elapsed)
+               sleep_time = max(0, (interval if self.is_leader else standby_interval) - elapsed)
                
                self.logger.debug('Waiting for next check', extra={
                    'next_check_in': sleep_time,
@@ -208,6 +292,9 @@ class DNSUpdater:
            raise
        finally:
            self.running = False
+           if self.is_leader:
+               await self.lease.release()
+               self.is_leader = False
 
    async def stop(self) -> None:
        """Gracefully stop the updater"""
@@ -0,0 +1,17 @@
+from typing import Type
+from .base import Lease
+from .null import NullLease
+from .file import FileLease
+from .aws.route53 import Route53Lease
+
+LEASES = {
+    'none': NullLease,
+    'file': FileLease,
+    'route53': Route53Lease
+}
+
+def get_lease(lease_name: str) -> Type[Lease]:
+    lease = LEASES.get(lease_name.lower())
+    if not lease:
+        raise ValueError(f"Lease '{lease_name}' not supported. Available leases: {', '.join(LEASES.keys())}")
+    return lease
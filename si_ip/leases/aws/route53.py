@@ -0,0 +1,151 @@
+import time
+import boto3
+from typing import Dict, Optional
+from botocore.exceptions import ClientError
+from ..base import Lease
+
+class Route53Lease(Lease):
+    """Lease stored as a TXT record in the hosted zone of the managed record.
+
+    Takeover deletes the exact TXT value that was read and creates the new
+    one in the same ChangeBatch, which Route 53 applies atomically, so only
+    one of several racing standbys can win. The holder renews by swapping out
+    the value it last wrote without listing first; if that value is gone the
+    lease was taken over and the swap fails.
+    """
+
+    def __init__(self, config, logger):
+        super().__init__(config, logger)
+        self.session = boto3.session.Session(
+            aws_access_key_id=config['aws_access_key_id'],
+            aws_secret_access_key=config['aws_secret_access_key']
+        )
+        self.client = self.session.client('route53')
+        self.name = config.get('lease_record_name') or f"_si-ip-lease.{config['record_name']}"
+        self.value: Optional[str] = None
+
+    @staticmethod
+    def _encode(holder: str, expires: float, state: Dict[str, str]) -> str:
+        fields = {'holder': holder, 'expires': str(int(expires)), **state}
+        return '"' + ' '.join(f'{key}={value}' for key, value in fields.items()) + '"'
+
+    @staticmethod
+    def _decode(value: str) -> dict:
+        fields = dict(
+            token.split('=', 1) for token in value.strip('"').split() if '=' in token
+        )
+        try:
+            expires = float(fields.pop('expires', 0))
+        except ValueError:
+            # Unreadable lease is treated as expired so it can be taken over
+            expires = 0
+        return {
+            'holder': fields.pop('holder', None),
+            'expires': expires,
+            'state': fields
+        }
+
+    def _get_value(self) -> Optional[str]:
+        response = self.client.list_resource_record_sets(
+            HostedZoneId=self.config['hosted_zone_id'],
+            StartRecordName=self.name,
+            StartRecordType='TXT',
+            MaxItems='1'
+        )
+        for record in response.get('ResourceRecordSets', []):
+            if record['Name'].rstrip('.') == self.name.rstrip('.') and record['Type'] == 'TXT':
+                return record['ResourceRecords'][0]['Value']
+        return None
+
+    def _txt_change(self, action: str, value: str) -> dict:
+        return {
+            'Action': action,
+            'ResourceRecordSet': {
+                'Name': self.name,
+                'Type': 'TXT',
+                'TTL': 60,
+                'ResourceRecords': [{'Value': value}]
+            }
+        }
+
+    def _swap(self, old_value: Optional[str], new_value: str, comment: str) -> None:
+        changes = [self._txt_change('CREATE', new_value)]
+        if old_value is not None:
+            changes.insert(0, self._txt_change('DELETE', old_value))
+        self.client.change_resource_record_sets(
+            HostedZoneId=self.config['hosted_zone_id'],
+            ChangeBatch={'Comment': comment, 'Changes': changes}
+        )
+
+    async def acquire(self, state: Optional[Dict[str, str]] = None) -> bool:
+        try:
+            if self.holder == self.holder_id and self.value:
+                old_value = self.value
+            else:
+                old_value = self._get_value()
+                lease = self._decode(old_value) if old_value else {'holder': None, 'expires': 0, 'state': {}}
+                self.holder = lease['holder']
+                self.state = lease['state']
+
+                if not self._is_free(self.holder, lease['expires']):
+                    return False
+
+            expires = time.time() + self.ttl
+            new_state = dict(state if state is not None else self.state)
+            new_value = self._encode(self.holder_id, expires, new_state)
+            self._swap(old_value, new_value, 'SI-IP lease renewal')
+            self.holder = self.holder_id
+            self.expires = expires
+            self.state = new_state
+            self.value = new_value
+            return True
+        except ClientError as e:
+            aws_error_code = e.response.get('Error', {}).get('Code', 'unknown')
+            if aws_error_code == 'InvalidChangeBatch':
+                # Another replica changed the lease between our read and
+                # write, it won the race; forget the cached value
+                self.logger.debug('Lease taken by another instance', extra={
+                    'lease_record_name': self.name,
+                    'aws_error_code': aws_error_code,
+                    'operation': 'lease_acquire'
+                })
+                self.holder = None
+                self.expires = 0.0
+                self.value = None
+                return False
+            self.logger.error('Failed to acquire lease', extra={
+                'error': str(e),
+                'error_type': type(e).__name__,
+                'lease_record_name': self.name,
+                'aws_error_code': aws_error_code,
+                'operation': 'lease_acquire'
+            })
+            return self._still_held()
+        except Exception as e:
+            self.logger.error('Failed to acquire lease', extra={
+                'error': str(e),
+                'error_type': type(e).__name__,
+                'lease_record_name': self.name,
+                'operation': 'lease_acquire'
+            })
+            return self._still_held()
+
+    async def release(self) -> None:
+        try:
+            old_value = self._get_value()
+            if not old_value:
+                return
+            lease = self._decode(old_value)
+            if lease['holder'] != self.holder_id:
+                return
+            self._swap(old_value, self._encode(self.holder_id, 0, lease['state']), 'SI-IP lease release')
+            self.holder = None
+            self.expires = 0.0
+            self.value = None
+        except Exception as e:
+            self.logger.error('Failed to release lease', extra={
+                'error': str(e),
+                'error_type': type(e).__name__,
+                'lease_record_name': self.name,
+                'operation': 'lease_release'
+            })
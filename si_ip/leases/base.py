@@ -0,0 +1,43 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+class Lease(ABC):
+    """Leadership lease deciding which replica resolves and writes a record set.
+
+    The holder renews the lease once less than half of `ttl` is left and
+    publishes its last known record state with it; standbys only read the
+    lease, keeping a copy of that state, and take over once it has not been
+    renewed for `ttl` seconds.
+    """
+
+    def __init__(self, config, logger):
+        self.config = config
+        self.logger = logger
+        self.holder_id = config['instance_id']
+        self.ttl = float(config.get('lease_ttl') or 3 * float(config['refresh_interval']))
+        self.holder: Optional[str] = None
+        self.expires = 0.0
+        self.state: Dict[str, str] = {}
+
+    def _is_free(self, holder: Optional[str], expires: float) -> bool:
+        return not holder or holder == self.holder_id or expires <= time.time()
+
+    def needs_renewal(self) -> bool:
+        """True unless this instance holds the lease with over ttl / 2 left"""
+        return self.holder != self.holder_id or self.expires - time.time() < self.ttl / 2
+
+    def _still_held(self) -> bool:
+        # Used when the backend could not be reached: keep holding a lease
+        # that has not expired yet instead of demoting a valid holder
+        return self.holder == self.holder_id and self.expires > time.time()
+
+    @abstractmethod
+    async def acquire(self, state: Optional[Dict[str, str]] = None) -> bool:
+        """Acquire or renew the lease, publishing state; True if held"""
+        pass
+
+    @abstractmethod
+    async def release(self) -> None:
+        """Give up the lease so a standby can take over immediately"""
+        pass
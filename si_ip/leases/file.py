@@ -0,0 +1,111 @@
+import os
+import json
+import time
+import fcntl
+import asyncio
+from typing import Dict, Optional
+from .base import Lease
+
+class FileLease(Lease):
+    """Lease stored as a JSON file on storage shared by all replicas"""
+
+    def __init__(self, config, logger):
+        super().__init__(config, logger)
+        self.path = os.path.join(
+            config['lease_path'],
+            f"{config['record_name'].rstrip('.')}.lease"
+        )
+
+    def _read(self, fd: int) -> dict:
+        os.lseek(fd, 0, os.SEEK_SET)
+        content = os.read(fd, 65536)
+        if not content:
+            return {}
+        try:
+            return json.loads(content)
+        except ValueError:
+            return {}
+
+    async def _lock(self, fd: int, attempts: int = 10) -> None:
+        # Never block the event loop on a lock held elsewhere, retry briefly
+        # and raise BlockingIOError if it is still busy
+        for attempt in range(attempts):
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return
+            except BlockingIOError:
+                if attempt == attempts - 1:
+                    raise
+                await asyncio.sleep(0.05)
+
+    def _write(self, fd: int, lease: dict) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        os.write(fd, json.dumps(lease).encode())
+        os.fsync(fd)
+
+    async def acquire(self, state: Optional[Dict[str, str]] = None) -> bool:
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                await self._lock(fd)
+                lease = self._read(fd)
+                self.holder = lease.get('holder')
+                self.state = lease.get('state', {})
+
+                if not self._is_free(self.holder, float(lease.get('expires', 0))):
+                    return False
+
+                self.holder = self.holder_id
+                self.expires = time.time() + self.ttl
+                self.state = dict(state if state is not None else self.state)
+                self._write(fd, {
+                    'holder': self.holder,
+                    'expires': self.expires,
+                    'state': self.state
+                })
+                return True
+            finally:
+                os.close(fd)
+        except BlockingIOError:
+            # A busy lock says nothing about who holds the lease
+            self.logger.debug('Lease file busy', extra={
+                'lease_path': self.path,
+                'operation': 'lease_acquire'
+            })
+            return self._still_held()
+        except OSError as e:
+            self.logger.error('Failed to acquire lease', extra={
+                'error': str(e),
+                'error_type': type(e).__name__,
+                'lease_path': self.path,
+                'operation': 'lease_acquire'
+            })
+            return self._still_held()
+
+    async def release(self) -> None:
+        try:
+            fd = os.open(self.path, os.O_RDWR)
+            try:
+                await self._lock(fd)
+                lease = self._read(fd)
+                if lease.get('holder') == self.holder_id:
+                    lease['expires'] = 0
+                    self._write(fd, lease)
+                    self.holder = None
+                    self.expires = 0.0
+            finally:
+                os.close(fd)
+        except BlockingIOError:
+            self.logger.warning('Lease file busy, lease left to expire', extra={
+                'lease_path': self.path,
+                'operation': 'lease_release'
+            })
+        except OSError as e:
+            self.logger.error('Failed to release lease', extra={
+                'error': str(e),
+                'error_type': type(e).__name__,
+                'lease_path': self.path,
+                'operation': 'lease_release'
+            })
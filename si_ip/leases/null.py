@@ -0,0 +1,14 @@
+from typing import Dict, Optional
+from .base import Lease
+
+class NullLease(Lease):
+    """Single instance mode, this replica is always the writer"""
+
+    async def acquire(self, state: Optional[Dict[str, str]] = None) -> bool:
+        self.holder = self.holder_id
+        self.expires = float('inf')
+        self.state = dict(state or {})
+        return True
+
+    async def release(self) -> None:
+        self.holder = None
@@ -1,9 +1,11 @@
 import boto3
-from typing import Optional
+from typing import Dict, Optional
 from botocore.exceptions import ClientError
 from ..base import DNSProvider
 
 class Route53Provider(DNSProvider):
+    RECORD_TYPES = ('A', 'AAAA')
+
     def __init__(self, config, logger):
         super().__init__(config, logger)
         self.session = boto3.session.Session(
@@ -12,16 +14,40 @@ class Route53Provider(DNSProvider):
         )
         self.client = self.session.client('route53')
 
+    def _list_records(self, name: str) -> list:
+        # Record sets are sorted by name then type, so starting at A and
+        # reading two entries returns both A and AAAA in a single call.
+        response = self.client.list_resource_record_sets(
+            HostedZoneId=self.config['hosted_zone_id'],
+            StartRecordName=name,
+            StartRecordType='A',
+            MaxItems=str(len(self.RECORD_TYPES))
+        )
+        return [
+            record for record in response.get('ResourceRecordSets', [])
+            if record['Name'].rstrip('.') == name.rstrip('.') and record['Type'] in self.RECORD_TYPES
+        ]
+
+    def _change_batch(self, name: str, ips: Dict[str, str], action: str, comment: str) -> dict:
+        return {
+            'Comment': comment,
+            'Changes': [
+                {
+                    'Action': action,
+                    'ResourceRecordSet': {
+                        'Name': name,
+                        'Type': record_type,
+                        'TTL': int(self.config['refresh_interval']),
+                        'ResourceRecords': [{'Value': ip}]
+                    }
+                }
+                for record_type, ip in ips.items()
+            ]
+        }
+
     async def record_exists(self, name: str) -> bool:
         try:
-            response = self.client.list_resource_record_sets(
-                HostedZoneId=self.config['hosted_zone_id'],
-                StartRecordName=name,
-                StartRecordType='A',
-                MaxItems='1'
-            )
-            records = response.get('ResourceRecordSets', [])
-            return any(record['Name'].rstrip('.') == name.rstrip('.') for record in records)
+            return bool(self._list_records(name))
         except Exception as e:
             self.logger.error('Failed to check record', extra={
                 'error': str(e),
@@ -31,98 +57,65 @@ class Route53Provider(DNSProvider):
             })
             return False
 
-    async def create_record(self, name: str, ip: str) -> bool:
+    async def create_records(self, name: str, ips: Dict[str, str]) -> bool:
         try:
             response = self.client.change_resource_record_sets(
                 HostedZoneId=self.config['hosted_zone_id'],
-                ChangeBatch={
-                    'Comment': 'Initial DNS record creation',
-                    'Changes': [
-                        {
-                            'Action': 'CREATE',
-                            'ResourceRecordSet': {
-                                'Name': name,
-                                'Type': 'A',
-                                'TTL': int(self.config['refresh_interval']),
-                                'ResourceRecords': [{'Value': ip}]
-                            }
-                        }
-                    ]
-                }
+                ChangeBatch=self._change_batch(name, ips, 'CREATE', 'Initial DNS record creation')
             )
-            self.logger.info('Created DNS record', extra={
+            self.logger.info('Created DNS records', extra={
                 'record_name': name,
-                'ip': ip,
+                'ips': ips,
                 'change_id': response['ChangeInfo']['Id'],
                 'operation': 'create_record'
             })
             return True
         except ClientError as e:
-            self.logger.error('Failed to create record', extra={
+            self.logger.error('Failed to create records', extra={
                 'error': str(e),
                 'error_type': type(e).__name__,
                 'record_name': name,
-                'ip': ip,
+                'ips': ips,
                 'aws_error_code': e.response.get('Error', {}).get('Code', 'unknown'),
                 'operation': 'create_record'
             })
             return False
 
-    async def update_record(self, name: str, ip: str) -> bool:
+    async def update_records(self, name: str, ips: Dict[str, str]) -> bool:
         try:
             response = self.client.change_resource_record_sets(
                 HostedZoneId=self.config['hosted_zone_id'],
-                ChangeBatch={
-                    'Comment': 'Automatic DNS update',
-                    'Changes': [
-                        {
-                            'Action': 'UPSERT',
-                            'ResourceRecordSet': {
-                                'Name': name,
-                                'Type': 'A',
-                                'TTL': int(self.config['refresh_interval']),
-                                'ResourceRecords': [{'Value': ip}]
-                            }
-                        }
-                    ]
-                }
+                ChangeBatch=self._change_batch(name, ips, 'UPSERT', 'Automatic DNS update')
             )
-            self.logger.info('Updated DNS record', extra={
+            self.logger.info('Updated DNS records', extra={
                 'record_name': name,
-                'ip': ip,
+                'ips': ips,
                 'change_id': response['ChangeInfo']['Id'],
                 'operation': 'update_record'
             })
             return True
         except ClientError as e:
-            self.logger.error('Failed to update record', extra={
+            self.logger.error('Failed to update records', extra={
                 'error': str(e),
                 'error_type': type(e).__name__,
                 'record_name': name,
-                'ip': ip,
+                'ips': ips,
                 'aws_error_code': e.response.get('Error', {}).get('Code', 'unknown'),
                 'operation': 'update_record'
             })
             return False
 
-    async def get_record_ip(self, name: str) -> Optional[str]:
+    async def get_record_ips(self, name: str) -> Dict[str, Optional[str]]:
+        ips: Dict[str, Optional[str]] = {record_type: None for record_type in self.RECORD_TYPES}
         try:
-            response = self.client.list_resource_record_sets(
-                HostedZoneId=self.config['hosted_zone_id'],
-                StartRecordName=name,
-                StartRecordType='A',
-                MaxItems='1'
-            )
-            records = response.get('ResourceRecordSets', [])
-            for record in records:
-                if record['Name'].rstrip('.') == name.rstrip('.') and record['Type'] == 'A':
-                    return record['ResourceRecords'][0]['Value']
-            return None
+            for record in self._list_records(name):
+                ips[record['Type']] = record['ResourceRecords'][0]['Value']
+            return ips
         except Exception as e:
-            self.logger.error('Failed to get record IP', extra={
+            self.logger.error('Failed to get record IPs', extra={
                 'error': str(e),
                 'error_type': type(e).__name__,
                 'record_name': name,
                 'operation': 'get_record_ip'
             })
-            return None
\ No newline at end of file
+            return ips
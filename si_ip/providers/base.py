@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional
 
 class DNSProvider(ABC):
     def __init__(self, config, logger):
@@ -8,20 +8,20 @@ class DNSProvider(ABC):
 
     @abstractmethod
     async def record_exists(self, name: str) -> bool:
-        """Check if record exists"""
+        """Check if an A or AAAA record exists"""
         pass
 
     @abstractmethod
-    async def create_record(self, name: str, ip: str) -> bool:
-        """Create a new DNS record"""
+    async def create_records(self, name: str, ips: Dict[str, str]) -> bool:
+        """Create new DNS records, ips maps record type ('A'/'AAAA') to IP"""
         pass
 
     @abstractmethod
-    async def update_record(self, name: str, ip: str) -> bool:
-        """Update existing DNS record"""
+    async def update_records(self, name: str, ips: Dict[str, str]) -> bool:
+        """Update DNS records in one change, ips maps record type to IP"""
         pass
 
     @abstractmethod
-    async def get_record_ip(self, name: str) -> Optional[str]:
-        """Get current IP from DNS record"""
-        pass
\ No newline at end of file
+    async def get_record_ips(self, name: str) -> Dict[str, Optional[str]]:
+        """Get current IPs from DNS records, keyed by record type"""
+        pass
@@ -1,20 +1,30 @@
-import re
 import random
 import asyncio
+import ipaddress
 import aiohttp
 from typing import Optional, Dict
 from datetime import datetime, timedelta
 
 class IPResolver:
-    IP_PATTERN = re.compile(r'(?:\d{1,3}\.){3}\d{1,3}')
-    
+    FAMILIES = (4, 6)
+
+    # Endpoints only publish an A (or AAAA) record, so the address family of
+    # the connection, and therefore of the reported IP, is fixed per server.
     SERVERS = {
-        'https://api.ipify.org': {'weight': 10, 'retries': 0},
-        'https://icanhazip.com': {'weight': 9, 'retries': 0},
-        'https://ifconfig.me/ip': {'weight': 8, 'retries': 0},
-        'https://ipecho.net/plain': {'weight': 7, 'retries': 0},
-        'https://myexternalip.com/raw': {'weight': 6, 'retries': 0},
-        'https://ifconfig.co':  {'weight': 5, 'retries': 0}
+        4: {
+            'https://api.ipify.org': {'weight': 10, 'retries': 0},
+            'https://ipv4.icanhazip.com': {'weight': 9, 'retries': 0},
+            'https://v4.ident.me': {'weight': 8, 'retries': 0},
+            'https://ipv4.seeip.org': {'weight': 7, 'retries': 0},
+            'https://ipv4.wtfismyip.com/text': {'weight': 6, 'retries': 0}
+        },
+        6: {
+            'https://api6.ipify.org': {'weight': 10, 'retries': 0},
+            'https://ipv6.icanhazip.com': {'weight': 9, 'retries': 0},
+            'https://v6.ident.me': {'weight': 8, 'retries': 0},
+            'https://ipv6.seeip.org': {'weight': 7, 'retries': 0},
+            'https://ipv6.wtfismyip.com/text': {'weight': 6, 'retries': 0}
+        }
     }
 
     def __init__(self):
@@ -27,55 +37,82 @@ class IPResolver:
         self.retry_after = timedelta(hours=1)
         self.max_retries = 3
 
-    async def get_ip(self) -> str:
-        servers = self._get_available_servers(3)
-        if not servers:
+    async def get_ips(self) -> Dict[int, Optional[str]]:
+        """Resolve IPv4 and IPv6 concurrently, keyed by IP version.
+
+        A family that cannot be resolved (e.g. no IPv6 connectivity) maps to
+        None; an error is raised only if no family could be resolved.
+        """
+        servers = {version: self._get_available_servers(version, 3) for version in self.FAMILIES}
+        if not any(servers.values()):
             await asyncio.sleep(300)  # Wait 5 minutes if all servers are blocked
-            servers = self._get_available_servers(3)
-            if not servers:
+            servers = {version: self._get_available_servers(version, 3) for version in self.FAMILIES}
+            if not any(servers.values()):
                 raise RuntimeError("No available IP resolution servers")
 
         async with aiohttp.ClientSession(headers=self.headers) as session:
-            tasks = [self._fetch_ip(session, server) for server in servers]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            valid_ips = [ip for ip in results if isinstance(ip, str) and ip]
-            if not valid_ips:
-                raise RuntimeError("Failed to fetch IP from any server")
-                
-            return max(set(valid_ips), key=valid_ips.count)
-
-    async def _fetch_ip(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
+            results = await asyncio.gather(*[
+                self._resolve(session, version, servers[version]) for version in self.FAMILIES
+            ])
+
+        ips = dict(zip(self.FAMILIES, results))
+        if not any(ips.values()):
+            raise RuntimeError("Failed to fetch IP from any server")
+        return ips
+
+    async def _resolve(self, session: aiohttp.ClientSession, version: int, servers: list) -> Optional[str]:
+        if not servers:
+            return None
+
+        tasks = [self._fetch_ip(session, version, server) for server in servers]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        valid_ips = [ip for ip in results if isinstance(ip, str) and ip]
+        if not valid_ips:
+            return None
+
+        return max(set(valid_ips), key=valid_ips.count)
+
+    async def _fetch_ip(self, session: aiohttp.ClientSession, version: int, url: str) -> Optional[str]:
         try:
             async with session.get(url, timeout=self.timeout) as response:
                 if response.status in {429, 403, 503}:
-                    self._mark_server_failed(url)
+                    self._mark_server_failed(version, url)
                     return None
-                    
+
                 if response.status != 200:
                     return None
-                
+
                 content = await response.text()
-                match = self.IP_PATTERN.search(content)
-                return match.group(0) if match else None
-                
+                return self._parse_ip(content, version)
+
         except Exception:
-            self._mark_server_failed(url)
+            self._mark_server_failed(version, url)
             return None
 
-    def _mark_server_failed(self, server: str) -> None:
-        self.SERVERS[server]['retries'] += 1
-        if self.SERVERS[server]['retries'] >= self.max_retries:
+    @staticmethod
+    def _parse_ip(content: str, version: int) -> Optional[str]:
+        try:
+            ip = ipaddress.ip_address(content.strip())
+        except ValueError:
+            return None
+        if ip.version != version:
+            return None
+        return str(ip)
+
+    def _mark_server_failed(self, version: int, server: str) -> None:
+        self.SERVERS[version][server]['retries'] += 1
+        if self.SERVERS[version][server]['retries'] >= self.max_retries:
             self.failed_servers[server] = datetime.now()
 
-    def _get_available_servers(self, count: int) -> list:
+    def _get_available_servers(self, version: int, count: int) -> list:
         available = [
-            server for server in self.SERVERS 
-            if server not in self.failed_servers or 
+            server for server in self.SERVERS[version]
+            if server not in self.failed_servers or
             datetime.now() - self.failed_servers[server] > self.retry_after
         ]
-        
+
         if not available:
             return []
-            
-        return random.sample(available, min(count, len(available)))
\ No newline at end of file
+
+        return random.sample(available, min(count, len(available)))
@@ -1,11 +1,17 @@
 import os
+import uuid
+import socket
 import configparser
 from typing import Dict, Any
+from ..leases import LEASES
 
 def load_config() -> Dict[str, Any]:
     config = {
         'provider': os.getenv('DNS_PROVIDER', 'aws'),
-        'refresh_interval': os.getenv('REFRESH_INTERVAL', '300')
+        'refresh_interval': os.getenv('REFRESH_INTERVAL', '300'),
+        'lease': 'none',
+        # Hostname and PID collide for containers sharing the host network
+        'instance_id': f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
     }
 
     parser = configparser.ConfigParser()
@@ -20,6 +26,10 @@ def load_config() -> Dict[str, Any]:
             config['refresh_interval'] = parser.get('global', 'refresh_interval', 
                                                   fallback=config['refresh_interval'])
 
+        # Load replica coordination configuration
+        if 'lease' in parser:
+            config.update(_load_lease_config(parser))
+
         # Load provider-specific configuration
         if config['provider'] == 'aws':
             config.update(_load_aws_config(parser))
@@ -33,6 +43,28 @@ def load_config() -> Dict[str, Any]:
             'record_name': os.getenv('RECORD_NAME', config.get('record_name'))
         })
 
+    # Lease environment variables override config file
+    config.update({
+        'lease': os.getenv('LEASE', config['lease']).lower(),
+        'lease_ttl': os.getenv('LEASE_TTL', config.get('lease_ttl')),
+        'lease_path': os.getenv('LEASE_PATH', config.get('lease_path')),
+        'lease_record_name': os.getenv('LEASE_RECORD_NAME', config.get('lease_record_name')),
+        'instance_id': os.getenv('INSTANCE_ID', config['instance_id'])
+    })
+
+    return config
+
+def _load_lease_config(parser: configparser.ConfigParser) -> Dict[str, str]:
+    config = {
+        'lease': parser.get('lease', 'type', fallback='none'),
+        'lease_ttl': parser.get('lease', 'ttl', fallback=''),
+        'lease_path': parser.get('lease', 'path', fallback=''),
+        'lease_record_name': parser.get('lease', 'record_name', fallback='')
+    }
+
+    if parser.get('lease', 'instance_id', fallback=''):
+        config['instance_id'] = parser.get('lease', 'instance_id')
+
     return config
 
 def _load_aws_config(parser: configparser.ConfigParser) -> Dict[str, str]:
@@ -62,4 +94,22 @@ def validate_config(config: Dict[str, Any]) -> None:
     missing_fields = [field for field in required_fields if not config.get(field)]
     
     if missing_fields:
-        raise ValueError(f"Missing required configuration: {', '.join(missing_fields)}")
\ No newline at end of file
+        raise ValueError(f"Missing required configuration: {', '.join(missing_fields)}")
+
+    lease = config.get('lease', 'none').lower()
+    if lease not in LEASES:
+        raise ValueError(f"Lease '{lease}' not supported. Available leases: {', '.join(LEASES.keys())}")
+
+    if lease == 'route53' and config['provider'] != 'aws':
+        raise ValueError("Lease 'route53' requires the 'aws' provider")
+
+    if lease == 'file' and not config.get('lease_path'):
+        raise ValueError("Missing required configuration: lease_path")
+
+    if any(char.isspace() for char in config.get('instance_id', '')):
+        raise ValueError("instance_id must not contain whitespace")
+
+    # Leave room for a slow cycle (e.g. all resolvers blocked) before a
+    # standby may consider the lease expired
+    if config.get('lease_ttl') and float(config['lease_ttl']) < 2 * float(config['refresh_interval']):
+        raise ValueError("lease_ttl must be at least twice refresh_interval")
\ No newline at end of file
@@ -0,0 +1,166 @@
+import os
+import time
+import fcntl
+from unittest.mock import MagicMock
+import pytest
+from botocore.exceptions import ClientError
+from si_ip.leases.file import FileLease
+from si_ip.leases.aws.route53 import Route53Lease
+
+def lease_config(instance_id, **extra):
+    return {
+        'instance_id': instance_id,
+        'refresh_interval': '10',
+        'lease_ttl': '30',
+        'record_name': 'www.example.com',
+        **extra
+    }
+
+@pytest.fixture
+def file_leases(tmp_path):
+    def make(instance_id):
+        return FileLease(lease_config(instance_id, lease_path=str(tmp_path)), MagicMock())
+    return make
+
+@pytest.mark.asyncio
+async def test_file_lease_single_holder(file_leases):
+    leader, standby = file_leases('a'), file_leases('b')
+
+    assert await leader.acquire({'A': '203.0.113.7'})
+    assert not await standby.acquire()
+    assert standby.holder == 'a'
+    assert standby.state == {'A': '203.0.113.7'}
+
+@pytest.mark.asyncio
+async def test_file_lease_takeover_after_expiry(file_leases, monkeypatch):
+    leader, standby = file_leases('a'), file_leases('b')
+    assert await leader.acquire({'A': '203.0.113.7'})
+
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 31)
+
+    assert await standby.acquire()
+    assert standby.state == {'A': '203.0.113.7'}
+    assert not await leader.acquire()
+    assert leader.holder == 'b'
+
+@pytest.mark.asyncio
+async def test_file_lease_release_hands_over(file_leases):
+    leader, standby = file_leases('a'), file_leases('b')
+    assert await leader.acquire()
+
+    await leader.release()
+
+    assert leader.holder is None
+    assert await standby.acquire()
+
+@pytest.mark.asyncio
+async def test_file_lease_busy_lock_keeps_valid_holder(file_leases):
+    leader, standby = file_leases('a'), file_leases('b')
+    assert await leader.acquire()
+
+    fd = os.open(leader.path, os.O_RDWR)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        assert await leader.acquire()
+        assert not await standby.acquire()
+    finally:
+        os.close(fd)
+
+@pytest.mark.asyncio
+async def test_file_lease_needs_renewal_after_half_ttl(file_leases, monkeypatch):
+    leader = file_leases('a')
+    assert leader.needs_renewal()
+    assert await leader.acquire()
+    assert not leader.needs_renewal()
+
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 16)
+    assert leader.needs_renewal()
+
+def route53_lease(instance_id):
+    lease = Route53Lease(lease_config(
+        instance_id,
+        aws_access_key_id='key',
+        aws_secret_access_key='secret',
+        hosted_zone_id='Z123'
+    ), MagicMock())
+    lease.client = MagicMock()
+    return lease
+
+def txt_records(value):
+    return {'ResourceRecordSets': [
+        {'Name': '_si-ip-lease.www.example.com.', 'Type': 'TXT', 'ResourceRecords': [{'Value': value}]}
+    ]}
+
+def test_route53_lease_round_trip():
+    value = Route53Lease._encode('host-1-abcd', 1700000000.5, {'A': '203.0.113.7', 'AAAA': '2001:db8::1'})
+
+    assert value == '"holder=host-1-abcd expires=1700000000 A=203.0.113.7 AAAA=2001:db8::1"'
+    assert Route53Lease._decode(value) == {
+        'holder': 'host-1-abcd',
+        'expires': 1700000000.0,
+        'state': {'A': '203.0.113.7', 'AAAA': '2001:db8::1'}
+    }
+
+def test_route53_lease_unparseable_expiry_is_expired():
+    assert Route53Lease._decode('"holder=a expires=soon"')['expires'] == 0
+
+@pytest.mark.asyncio
+async def test_route53_lease_takeover_swaps_atomically():
+    lease = route53_lease('b')
+    old_value = Route53Lease._encode('a', time.time() - 1, {'A': '203.0.113.7'})
+    lease.client.list_resource_record_sets.return_value = txt_records(old_value)
+
+    assert await lease.acquire()
+
+    changes = lease.client.change_resource_record_sets.call_args.kwargs['ChangeBatch']['Changes']
+    assert [c['Action'] for c in changes] == ['DELETE', 'CREATE']
+    assert changes[0]['ResourceRecordSet']['ResourceRecords'] == [{'Value': old_value}]
+    assert Route53Lease._decode(changes[1]['ResourceRecordSet']['ResourceRecords'][0]['Value'])['holder'] == 'b'
+    assert lease.state == {'A': '203.0.113.7'}
+
+@pytest.mark.asyncio
+async def test_route53_lease_renewal_skips_list():
+    lease = route53_lease('a')
+    lease.client.list_resource_record_sets.return_value = {'ResourceRecordSets': []}
+    assert await lease.acquire()
+    written = lease.value
+
+    assert await lease.acquire({'A': '203.0.113.7'})
+
+    lease.client.list_resource_record_sets.assert_called_once()
+    changes = lease.client.change_resource_record_sets.call_args.kwargs['ChangeBatch']['Changes']
+    assert changes[0]['ResourceRecordSet']['ResourceRecords'] == [{'Value': written}]
+
+@pytest.mark.asyncio
+async def test_route53_lease_held_by_other_is_not_acquired():
+    lease = route53_lease('b')
+    lease.client.list_resource_record_sets.return_value = txt_records(
+        Route53Lease._encode('a', time.time() + 30, {})
+    )
+
+    assert not await lease.acquire()
+    assert lease.holder == 'a'
+    lease.client.change_resource_record_sets.assert_not_called()
+
+def client_error(code):
+    return ClientError({'Error': {'Code': code, 'Message': code}}, 'ChangeResourceRecordSets')
+
+@pytest.mark.asyncio
+async def test_route53_lease_invalid_change_batch_is_lost_race():
+    lease = route53_lease('b')
+    lease.client.list_resource_record_sets.return_value = {'ResourceRecordSets': []}
+    lease.client.change_resource_record_sets.side_effect = client_error('InvalidChangeBatch')
+
+    assert not await lease.acquire()
+    lease.logger.error.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_route53_lease_other_client_errors_are_logged():
+    lease = route53_lease('b')
+    lease.client.list_resource_record_sets.return_value = {'ResourceRecordSets': []}
+    lease.client.change_resource_record_sets.side_effect = client_error('AccessDenied')
+
+    assert not await lease.acquire()
+    lease.logger.error.assert_called_once()
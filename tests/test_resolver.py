@@ -0,0 +1,37 @@
+from unittest.mock import patch
+import pytest
+from si_ip.resolvers.ip import IPResolver
+
+@pytest.mark.parametrize('content, version, expected', [
+    ('203.0.113.7\n', 4, '203.0.113.7'),
+    ('  2001:DB8:0:0::1 \n', 6, '2001:db8::1'),
+    ('203.0.113.7', 6, None),
+    ('2001:db8::1', 4, None),
+    ('<html>203.0.113.7</html>', 4, None),
+    ('999.1.1.1', 4, None),
+    ('', 4, None),
+])
+def test_parse_ip(content, version, expected):
+    assert IPResolver._parse_ip(content, version) == expected
+
+@pytest.mark.asyncio
+async def test_get_ips_maps_failed_family_to_none():
+    resolver = IPResolver()
+    results = {4: '203.0.113.7', 6: None}
+
+    async def resolve(session, version, servers):
+        return results[version]
+
+    with patch.object(resolver, '_resolve', side_effect=resolve):
+        assert await resolver.get_ips() == {4: '203.0.113.7', 6: None}
+
+@pytest.mark.asyncio
+async def test_get_ips_raises_when_all_families_fail():
+    resolver = IPResolver()
+
+    async def resolve(session, version, servers):
+        return None
+
+    with patch.object(resolver, '_resolve', side_effect=resolve):
+        with pytest.raises(RuntimeError):
+            await resolver.get_ips()
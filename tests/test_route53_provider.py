@@ -0,0 +1,62 @@
+from unittest.mock import MagicMock
+import pytest
+from si_ip.providers.aws.route53 import Route53Provider
+
+CONFIG = {
+    'aws_access_key_id': 'key',
+    'aws_secret_access_key': 'secret',
+    'hosted_zone_id': 'Z123',
+    'record_name': 'www.example.com',
+    'refresh_interval': '300'
+}
+
+@pytest.fixture
+def provider():
+    provider = Route53Provider(CONFIG, MagicMock())
+    provider.client = MagicMock()
+    return provider
+
+def record(name, record_type, value):
+    return {'Name': name, 'Type': record_type, 'ResourceRecords': [{'Value': value}]}
+
+def test_change_batch_holds_both_families(provider):
+    batch = provider._change_batch(
+        'www.example.com', {'A': '203.0.113.7', 'AAAA': '2001:db8::1'}, 'UPSERT', 'update'
+    )
+
+    assert batch['Comment'] == 'update'
+    assert [(c['Action'], c['ResourceRecordSet']['Type'], c['ResourceRecordSet']['ResourceRecords'])
+            for c in batch['Changes']] == [
+        ('UPSERT', 'A', [{'Value': '203.0.113.7'}]),
+        ('UPSERT', 'AAAA', [{'Value': '2001:db8::1'}]),
+    ]
+    assert all(c['ResourceRecordSet']['TTL'] == 300 for c in batch['Changes'])
+
+@pytest.mark.asyncio
+async def test_update_records_sends_single_change_batch(provider):
+    provider.client.change_resource_record_sets.return_value = {'ChangeInfo': {'Id': 'C1'}}
+
+    assert await provider.update_records('www.example.com', {'A': '203.0.113.7', 'AAAA': '2001:db8::1'})
+
+    provider.client.change_resource_record_sets.assert_called_once()
+    changes = provider.client.change_resource_record_sets.call_args.kwargs['ChangeBatch']['Changes']
+    assert {c['ResourceRecordSet']['Type'] for c in changes} == {'A', 'AAAA'}
+
+def test_list_records_filters_name_and_type(provider):
+    provider.client.list_resource_record_sets.return_value = {'ResourceRecordSets': [
+        record('www.example.com.', 'A', '203.0.113.7'),
+        record('www.example.com.', 'TXT', '"hello"'),
+        record('www2.example.com.', 'AAAA', '2001:db8::2'),
+    ]}
+
+    assert provider._list_records('www.example.com') == [record('www.example.com.', 'A', '203.0.113.7')]
+    assert provider.client.list_resource_record_sets.call_args.kwargs['MaxItems'] == '2'
+
+@pytest.mark.asyncio
+async def test_get_record_ips_missing_family_is_none(provider):
+    provider.client.list_resource_record_sets.return_value = {'ResourceRecordSets': [
+        record('www.example.com.', 'AAAA', '2001:db8::1'),
+        record('xyz.example.com.', 'A', '203.0.113.9'),
+    ]}
+
+    assert await provider.get_record_ips('www.example.com') == {'A': None, 'AAAA': '2001:db8::1'}
@@ -0,0 +1,50 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+import pytest
+from si_ip.core.updater import DNSUpdater
+
+def make_updater(tmp_path, instance_id):
+    config = {
+        'provider': 'aws',
+        'aws_access_key_id': 'key',
+        'aws_secret_access_key': 'secret',
+        'hosted_zone_id': 'Z123',
+        'record_name': 'www.example.com',
+        'refresh_interval': '10',
+        'lease': 'file',
+        'lease_path': str(tmp_path),
+        'instance_id': instance_id
+    }
+    updater = DNSUpdater(config, MagicMock())
+    updater.ip_resolver = MagicMock(get_ips=AsyncMock(return_value={4: '203.0.113.7', 6: None}))
+    updater.dns_provider = MagicMock(
+        record_exists=AsyncMock(return_value=True),
+        get_record_ips=AsyncMock(return_value={'A': '198.51.100.1', 'AAAA': None}),
+        update_records=AsyncMock(return_value=True)
+    )
+    return updater
+
+async def run_one_cycle(updater):
+    async def stop(_):
+        updater.running = False
+
+    with patch('si_ip.core.updater.asyncio.sleep', side_effect=stop):
+        await updater.run()
+
+@pytest.mark.asyncio
+async def test_standby_never_resolves_or_writes(tmp_path):
+    leader, standby = make_updater(tmp_path, 'a'), make_updater(tmp_path, 'b')
+    assert await leader.lease.acquire()
+
+    await run_one_cycle(standby)
+
+    standby.ip_resolver.get_ips.assert_not_called()
+    standby.dns_provider.record_exists.assert_not_called()
+    standby.dns_provider.update_records.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_leader_updates_changed_family_only(tmp_path):
+    leader = make_updater(tmp_path, 'a')
+
+    await run_one_cycle(leader)
+
+    leader.dns_provider.update_records.assert_awaited_once_with('www.example.com', {'A': '203.0.113.7'})